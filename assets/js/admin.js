@@ -0,0 +1,204 @@
+function premiumConfirm(url, itemName) {
+    Swal.fire({
+        title: 'Are you sure?',
+        text: `Delete "${itemName}" permanently?`,
+        icon: 'warning',
+        showCancelButton: true,
+        confirmButtonColor: '#ff416c',
+        cancelButtonColor: '#2c3e50',
+        confirmButtonText: '<i class="fas fa-trash"></i> Delete',
+        cancelButtonText: 'Cancel',
+        showClass: { popup: 'animate__animated animate__zoomIn' },
+        hideClass: { popup: 'animate__animated animate__fadeOut' },
+        borderRadius: '15px'
+    }).then((result) => {
+        if (result.isConfirmed) {
+            Swal.fire({ title: 'Removing...', icon: 'success', showConfirmButton: false, timer: 1000 });
+            setTimeout(() => { window.location.href = url; }, 1000);
+        }
+    });
+}
+
+function changeStatus(orderId, status) {
+    fetch(`/update_status/${orderId}`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-Requested-With': 'XMLHttpRequest'
+        },
+        body: JSON.stringify({ status: status })
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            const Toast = Swal.mixin({ toast: true, position: 'top-end', showConfirmButton: false, timer: 2000 });
+            Toast.fire({ icon: 'success', title: `Order updated to ${status}` });
+        }
+    })
+    .catch(err => {
+        Swal.fire({ icon: 'error', title: 'Error', text: 'Update failed!' });
+    });
+}
+
+// --- ORDER TABLE (paged from /api/admin/orders) ---
+const ORDER_STATUSES = ['Pending', 'Processing', 'Shipped', 'Out for Delivery', 'Delivered'];
+
+function escapeHtml(value) {
+    return String(value ?? '').replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+}
+
+function orderRow(o) {
+    const tr = document.createElement('tr');
+    tr.dataset.orderId = o.id;
+    const shortId = o.id.slice(-5);
+    const date = o.date_ordered ? new Date(o.date_ordered + 'Z').toLocaleDateString('en-GB', { day: '2-digit', month: 'short' }) : 'N/A';
+    const options = ORDER_STATUSES.map(s => `<option value="${s}" ${o.status === s ? 'selected' : ''}>${s}</option>`).join('');
+    tr.innerHTML = `
+        <td><b>#${shortId}</b><br><small>${date}</small></td>
+        <td><strong>${escapeHtml(o.name)}</strong><br><small>${escapeHtml(o.phone)}</small></td>
+        <td><div class="address-box">${escapeHtml(o.house_no)}, ${escapeHtml(o.address)}<br><b>PIN:</b> ${escapeHtml(o.pincode)}</div></td>
+        <td><div class="story-box">${escapeHtml(o.custom_details)}</div></td>
+        <td>
+            <select style="padding: 5px; border-radius: 5px; border: 1px solid var(--primary); font-size: 11px; width: auto;">${options}</select>
+        </td>
+        <td>
+            <span class="badge" style="background: #fdf2f2;">${escapeHtml(o.items)}</span><br>
+            <b style="color: var(--primary);">₹${escapeHtml(o.total)}</b>
+        </td>
+        <td>
+            <button class="btn-delete"><i class="fas fa-trash"></i></button>
+            <br>
+            <a href="/download_invoice/${o.id}" style="font-size: 10px; text-decoration: none; color: #2c3e50;">
+                <i class="fas fa-file-pdf"></i> PDF
+            </a>
+        </td>`;
+    tr.querySelector('select').addEventListener('change', e => changeStatus(o.id, e.target.value));
+    tr.querySelector('.btn-delete').addEventListener('click', () => premiumConfirm(`/delete_order/${o.id}`, `Order #${shortId}`));
+    return tr;
+}
+
+async function loadOrders(reset) {
+    const btn = document.getElementById('load-more-orders');
+    const params = new URLSearchParams();
+    new FormData(document.getElementById('order-filters')).forEach((v, k) => { if (v) params.set(k, v); });
+    if (!reset && btn.dataset.nextCursor) params.set('after', btn.dataset.nextCursor);
+    try {
+        const res = await fetch('/api/admin/orders?' + params.toString());
+        const data = await res.json();
+        if (!data.success) throw new Error(data.message);
+        const body = document.getElementById('orders-body');
+        if (reset) body.innerHTML = '';
+        data.orders.forEach(o => body.appendChild(orderRow(o)));
+        btn.dataset.nextCursor = data.next_cursor || '';
+        btn.style.display = data.next_cursor ? '' : 'none';
+    } catch (err) {
+        Swal.fire({ icon: 'error', title: 'Error', text: 'Could not load orders!' });
+    }
+}
+
+// --- SALES OVERVIEW (from /api/admin/analytics) ---
+async function loadAnalytics() {
+    try {
+        const res = await fetch('/api/admin/analytics?days=7');
+        const data = await res.json();
+        if (!data.success) return;
+        if (!data.built) {
+            document.getElementById('stats-orders-week').innerText = 'Summary not built yet';
+            return;
+        }
+        const revenue = data.revenue_by_day.reduce((sum, d) => sum + d.revenue, 0);
+        const orders = data.revenue_by_day.reduce((sum, d) => sum + d.orders, 0);
+        document.getElementById('stats-revenue-week').innerText = `₹${revenue.toLocaleString('en-IN')}`;
+        document.getElementById('stats-orders-week').innerText = `${orders} orders`;
+        document.getElementById('stats-status').innerHTML = Object.entries(data.status_counts)
+            .map(([status, count]) => `<span class="badge">${escapeHtml(status)}: ${count}</span>`).join(' ');
+        document.getElementById('stats-items').innerHTML = data.top_items.slice(0, 5)
+            .map(item => `<div><small>${escapeHtml(item.key)} × ${item.orders}</small></div>`).join('');
+    } catch (err) {
+        console.error(err);
+    }
+}
+loadAnalytics();
+
+// --- ORDER EXPORT (streamed CSV / NDJSON) ---
+function exportOrders(format) {
+    const params = new URLSearchParams({ format: format });
+    new FormData(document.getElementById('order-filters')).forEach((v, k) => { if (v) params.set(k, v); });
+    window.location.href = '/admin/orders/export?' + params.toString();
+}
+
+// --- BULK INVOICE EXPORT ---
+function exportInvoices() {
+    const params = new URLSearchParams();
+    new FormData(document.getElementById('order-filters')).forEach((v, k) => { if (v) params.set(k, v); });
+    const exportId = Date.now().toString(36) + Math.random().toString(36).slice(2, 8);
+    params.set('export_id', exportId);
+    window.location.href = '/admin/invoices.zip?' + params.toString();
+
+    const box = document.getElementById('export-progress');
+    box.style.display = 'block';
+    box.innerText = 'Preparing invoices...';
+    const timer = setInterval(async () => {
+        try {
+            const res = await fetch(`/api/admin/exports/${exportId}`);
+            const data = await res.json();
+            if (!data.success) return;
+            box.innerText = `Invoices: ${data.done} / ${data.total}`;
+            if (data.finished) {
+                clearInterval(timer);
+                box.innerText = `Invoices: ${data.done} / ${data.total} ✔`;
+            }
+        } catch (err) {
+            clearInterval(timer);
+        }
+    }, 1500);
+}
+
+document.getElementById('order-filters').addEventListener('submit', e => {
+    e.preventDefault();
+    loadOrders(true);
+});
+
+// --- LIVE ORDER FEED (Server-Sent Events) ---
+function orderFiltersActive() {
+    return [...new FormData(document.getElementById('order-filters')).values()].some(v => v);
+}
+
+let analyticsTimer = null;
+function refreshAnalyticsSoon() {
+    clearTimeout(analyticsTimer);
+    analyticsTimer = setTimeout(loadAnalytics, 2000);
+}
+
+function findOrderRow(id) {
+    return document.querySelector(`#orders-body tr[data-order-id="${CSS.escape(id)}"]`);
+}
+
+if (window.EventSource) {
+    const feed = new EventSource('/api/admin/orders/events');
+    feed.addEventListener('order_created', e => {
+        const o = JSON.parse(e.data);
+        // A filtered table may not include the new order; the filter button reloads it
+        if (!findOrderRow(o.id) && !orderFiltersActive()) {
+            const row = orderRow(o);
+            row.classList.add('animate__animated', 'animate__flash');
+            document.getElementById('orders-body').prepend(row);
+        }
+        refreshAnalyticsSoon();
+    });
+    feed.addEventListener('status_changed', e => {
+        const d = JSON.parse(e.data);
+        const row = findOrderRow(d.id);
+        if (row) row.querySelector('select').value = d.status;
+        refreshAnalyticsSoon();
+    });
+    feed.addEventListener('order_deleted', e => {
+        const row = findOrderRow(JSON.parse(e.data).id);
+        if (row) row.remove();
+        refreshAnalyticsSoon();
+    });
+    feed.addEventListener('resync', () => {
+        loadOrders(true);
+        refreshAnalyticsSoon();
+    });
+}
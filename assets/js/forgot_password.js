@@ -0,0 +1,54 @@
+const form = document.getElementById('forgotForm');
+const inputs = document.querySelectorAll('.q-input');
+const counterBadge = document.getElementById('ansCounter');
+const submitBtn = document.getElementById('submitBtn');
+const toggleEye = document.getElementById('toggleEye');
+const passwordInput = document.getElementById('new_password');
+
+// Password visibility toggle
+toggleEye.addEventListener('click', function () {
+    const type = passwordInput.getAttribute('type') === 'password' ? 'text' : 'password';
+    passwordInput.setAttribute('type', type);
+    this.classList.toggle('fa-eye-slash');
+});
+
+// Counter and box color logic
+function updateCounter() {
+    let filledCount = 0;
+    inputs.forEach(input => {
+        const parent = input.closest('.q-box');
+        if (input.value.trim() !== "") {
+            filledCount++;
+            parent.classList.add('filled');
+        } else {
+            parent.classList.remove('filled');
+        }
+    });
+
+    counterBadge.innerText = `${filledCount} / 3 Filled`;
+
+    if (filledCount >= 3) {
+        counterBadge.style.background = "#28a745"; // Green if enough
+    } else {
+        counterBadge.style.background = "#ff416c"; // Original Pink
+    }
+    return filledCount;
+}
+
+inputs.forEach(input => {
+    input.addEventListener('input', updateCounter);
+});
+
+// Form submission
+form.onsubmit = function(e) {
+    const count = updateCounter();
+    if (count < 3) {
+        alert("Security Alert: Please answer at least 3 security questions to prove your identity.");
+        e.preventDefault();
+        return false;
+    }
+
+    // Show loading state
+    submitBtn.disabled = true;
+    submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Verifying...';
+};
@@ -0,0 +1,32 @@
+const menuToggle = document.getElementById('mobile-menu');
+const navList = document.getElementById('nav-list');
+
+// Toggle Mobile Menu
+menuToggle.addEventListener('click', () => {
+    navList.classList.toggle('active');
+    const icon = menuToggle.querySelector('i');
+    icon.classList.toggle('fa-bars');
+    icon.classList.toggle('fa-times');
+});
+
+// Close menu when link is clicked
+document.querySelectorAll('.nav-links a').forEach(link => {
+    link.addEventListener('click', () => {
+        navList.classList.remove('active');
+        const icon = menuToggle.querySelector('i');
+        icon.classList.add('fa-bars');
+        icon.classList.remove('fa-times');
+    });
+});
+
+// Simple Navbar effect on scroll
+window.addEventListener('scroll', () => {
+    const nav = document.querySelector('nav');
+    if (window.scrollY > 50) {
+        nav.style.padding = '10px 8%';
+        nav.style.backgroundColor = 'rgba(255, 255, 255, 0.98)';
+    } else {
+        nav.style.padding = '15px 8%';
+        nav.style.backgroundColor = '#fff';
+    }
+});
@@ -0,0 +1,23 @@
+// Password Visibility Toggle
+function togglePass() {
+    const passInput = document.getElementById('adminPass');
+    const eyeIcon = document.getElementById('eyeIcon');
+
+    if (passInput.type === 'password') {
+        passInput.type = 'text';
+        eyeIcon.classList.replace('fa-eye', 'fa-eye-slash');
+    } else {
+        passInput.type = 'password';
+        eyeIcon.classList.replace('fa-eye-slash', 'fa-eye');
+    }
+}
+
+// Form Submit Animation
+const loginForm = document.getElementById('adminLoginForm');
+const submitBtn = document.getElementById('submitBtn');
+
+loginForm.onsubmit = function() {
+    submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Verifying...';
+    submitBtn.style.opacity = '0.8';
+    submitBtn.style.pointerEvents = 'none';
+};
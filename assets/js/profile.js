@@ -0,0 +1,22 @@
+// Preview Image before upload
+function previewImage(input) {
+    if (input.files && input.files[0]) {
+        var reader = new FileReader();
+        reader.onload = function(e) {
+            document.getElementById('profilePreview').src = e.target.result;
+            // Show the "Save" button only after image selection
+            document.getElementById('photoUpdatePrompt').style.display = 'block';
+        }
+        reader.readAsDataURL(input.files[0]);
+    }
+}
+
+// Auto-active Tab logic (if redirected from update)
+window.onload = function() {
+    const urlParams = new URLSearchParams(window.location.search);
+    if (urlParams.has('tab')) {
+        const tabId = urlParams.get('tab');
+        const tabBtn = document.querySelector(`#${tabId}-tab`);
+        if (tabBtn) tabBtn.click();
+    }
+}
@@ -0,0 +1,38 @@
+const form = document.getElementById('registrationForm');
+const inputs = document.querySelectorAll('.sec-input');
+const counterBadge = document.getElementById('ansCounter');
+
+function updateCounter() {
+    let filledCount = 0;
+    inputs.forEach(input => {
+        const parent = input.closest('.security-box');
+        if (input.value.trim() !== "") {
+            filledCount++;
+            parent.classList.add('filled');
+        } else {
+            parent.classList.remove('filled');
+        }
+    });
+
+    counterBadge.innerText = `${filledCount} / 3 Filled`;
+
+    if (filledCount >= 3) {
+        counterBadge.style.background = "#28a745"; 
+    } else {
+        counterBadge.style.background = "#ff4d6d";
+    }
+    return filledCount;
+}
+
+inputs.forEach(input => {
+    input.addEventListener('input', updateCounter);
+});
+
+form.onsubmit = function(e) {
+    const count = updateCounter();
+    if (count < 3) {
+        alert("Security Setup Incomplete: Please answer at least 3 security questions to protect your account.");
+        e.preventDefault();
+        return false;
+    }
+};
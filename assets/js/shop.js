@@ -0,0 +1,140 @@
+let selectedProduct = { name: "", price: "" };
+let idempotencyKey = null;
+function newIdempotencyKey() {
+    return (window.crypto && crypto.randomUUID) ? crypto.randomUUID() : Date.now().toString(36) + Math.random().toString(36).slice(2);
+}
+function handleQuickOrder(name, price) {
+    selectedProduct = { name: name, price: price };
+    // A fresh key per opened checkout; retries of this order reuse it
+    idempotencyKey = newIdempotencyKey();
+    document.getElementById('item-info').innerText = `${name} • ₹${price}`;
+    document.getElementById('modal-overlay').style.display = 'flex';
+}
+function closeCheckout() { document.getElementById('modal-overlay').style.display = 'none'; }
+
+// --- INFINITE SCROLL (keyset pages from /api/products) ---
+function escapeHtml(value) {
+    return String(value ?? '').replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+}
+function productCard(p) {
+    const card = document.createElement('div');
+    card.className = 'product-card animate__animated animate__fadeInUp';
+    const img = p.image || 'https://via.placeholder.com/500x600?text=HeartScript+Art';
+    const desc = p.description || 'Exquisite calligraphy handcrafted on museum-grade premium paper.';
+    card.innerHTML = `
+        <div class="exclusive-tag">Exclusive</div>
+        <div class="img-container">
+            <picture>
+                ${p.image_webp_srcset ? `<source type="image/webp" srcset="${escapeHtml(p.image_webp_srcset)}" sizes="(max-width: 768px) 140px, 300px">` : ''}
+                <img src="${escapeHtml(img)}" ${p.image_srcset ? `srcset="${escapeHtml(p.image_srcset)}" sizes="(max-width: 768px) 140px, 300px"` : ''}
+                     class="product-img" alt="${escapeHtml(p.name)}" loading="lazy"
+                     onerror="this.src='https://via.placeholder.com/500x600?text=Handcrafted+Art';">
+            </picture>
+        </div>
+        <div class="product-info">
+            <h3>${escapeHtml(p.name)}</h3>
+            <p>${escapeHtml(desc)}...</p>
+            <div class="price-row">
+                <span class="price">₹${escapeHtml(p.price)}</span>
+                <span style="font-size: 0.75rem; color: #2ecc71; font-weight: 700;">
+                    <i class="fas fa-check-circle"></i> Artisan Ready
+                </span>
+            </div>
+            <div class="btn-actions">
+                <a href="${escapeHtml(p.url)}" class="btn-view-details"><i class="fas fa-expand-alt"></i></a>
+                <button class="btn-order-quick">Instant Order</button>
+            </div>
+        </div>`;
+    card.querySelector('.btn-order-quick').addEventListener('click', () => handleQuickOrder(p.name, p.price));
+    return card;
+}
+
+const sentinel = document.getElementById('load-more-sentinel');
+let loadingPage = false;
+async function loadNextPage() {
+    const cursor = sentinel.dataset.nextCursor;
+    if (!cursor || loadingPage || document.getElementById('products-grid').style.display === 'none') return;
+    loadingPage = true;
+    try {
+        const params = new URLSearchParams({ after: cursor });
+        if (sentinel.dataset.category) params.set('category', sentinel.dataset.category);
+        const res = await fetch('/api/products?' + params.toString());
+        const data = await res.json();
+        const grid = document.getElementById('products-grid');
+        (data.products || []).forEach(p => grid.appendChild(productCard(p)));
+        sentinel.dataset.nextCursor = data.next_cursor || '';
+    } catch (err) {
+        console.error(err);
+    } finally {
+        loadingPage = false;
+    }
+}
+
+// --- SEARCH & AUTOCOMPLETE (in-memory index behind /api/search) ---
+const searchInput = document.getElementById('search-input');
+let suggestTimer = null;
+searchInput.addEventListener('input', () => {
+    clearTimeout(suggestTimer);
+    const q = searchInput.value.trim();
+    if (!q) { showSearchResults(false); return; }
+    suggestTimer = setTimeout(async () => {
+        try {
+            const res = await fetch('/api/search/suggest?' + new URLSearchParams({ q: q }).toString());
+            const data = await res.json();
+            document.getElementById('search-suggestions').innerHTML = (data.suggestions || [])
+                .map(s => `<option value="${escapeHtml(s.name)}"></option>`).join('');
+        } catch (err) { console.error(err); }
+    }, 120);
+});
+function showSearchResults(show) {
+    document.getElementById('search-results').style.display = show ? '' : 'none';
+    document.getElementById('products-grid').style.display = show ? 'none' : '';
+}
+document.getElementById('search-form').addEventListener('submit', async e => {
+    e.preventDefault();
+    const q = searchInput.value.trim();
+    if (!q) { showSearchResults(false); return; }
+    try {
+        const res = await fetch('/api/search?' + new URLSearchParams({ q: q }).toString());
+        const data = await res.json();
+        const results = document.getElementById('search-results');
+        results.innerHTML = '';
+        (data.products || []).forEach(p => results.appendChild(productCard(p)));
+        if (!results.children.length) {
+            results.innerHTML = '<div style="grid-column: 1/-1; text-align: center; padding: 60px 20px; color: #ffccd5;">No artworks match your search.</div>';
+        }
+        showSearchResults(true);
+    } catch (err) { console.error(err); }
+});
+
+if ('IntersectionObserver' in window) {
+    new IntersectionObserver(entries => {
+        if (entries.some(e => e.isIntersecting)) loadNextPage();
+    }, { rootMargin: '600px' }).observe(sentinel);
+}
+
+async function submitOrder() {
+    const btn = document.getElementById('submit-btn');
+    const orderData = {
+        name: document.getElementById('cust_name').value.trim(),
+        phone: document.getElementById('cust_phone').value.trim(),
+        address: document.getElementById('cust_address').value.trim(),
+        custom_details: document.getElementById('cust_details').value.trim(),
+        items: selectedProduct.name,
+        total: String(selectedProduct.price)
+    };
+
+    if(!orderData.name || !orderData.phone || !orderData.address) { alert("Fill all details!"); return; }
+    btn.disabled = true; btn.innerHTML = 'Placing Order...';
+
+    try {
+        const response = await fetch('/submit_order', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json', 'Idempotency-Key': idempotencyKey },
+            body: JSON.stringify(orderData)
+        });
+        const resData = await response.json();
+        if (resData.order_id) window.location.href = "/thank_you/" + resData.order_id;
+        else { alert(resData.message); btn.disabled = false; }
+    } catch (err) { alert("Error!"); btn.disabled = false; }
+}
@@ -0,0 +1,83 @@
+// High-end Confetti Animation
+function fireConfetti() {
+    const duration = 3 * 1000;
+    const animationEnd = Date.now() + duration;
+    const defaults = { startVelocity: 30, spread: 360, ticks: 60, zIndex: 0 };
+
+    function randomInRange(min, max) {
+        return Math.random() * (max - min) + min;
+    }
+
+    const interval = setInterval(function() {
+        const timeLeft = animationEnd - Date.now();
+
+        if (timeLeft <= 0) {
+            return clearInterval(interval);
+        }
+
+        const particleCount = 50 * (timeLeft / duration);
+        confetti(Object.assign({}, defaults, { 
+            particleCount, 
+            origin: { x: randomInRange(0.1, 0.3), y: Math.random() - 0.2 } 
+        }));
+        confetti(Object.assign({}, defaults, { 
+            particleCount, 
+            origin: { x: randomInRange(0.7, 0.9), y: Math.random() - 0.2 } 
+        }));
+    }, 250);
+}
+
+// Persistent Wishlist Sync
+let wishlist = JSON.parse(localStorage.getItem('heartscript_wish')) || [];
+
+function updateWishlistDisplay() {
+    const badge = document.getElementById('wish-count-badge');
+    const listContainer = document.getElementById('wish-list-items');
+
+    if(badge) badge.innerText = wishlist.length;
+
+    if(listContainer) {
+        if(wishlist.length === 0) {
+            listContainer.innerHTML = `
+                <div style="text-align:center; margin-top:60px; color:#ddd;">
+                    <i class="fas fa-heart-broken fa-3x" style="margin-bottom: 15px; opacity: 0.5;"></i>
+                    <p style="font-weight: 500; font-size: 0.9rem;">Your wishlist is empty.</p>
+                </div>`;
+            return;
+        }
+
+        listContainer.innerHTML = wishlist.map((item, index) => `
+            <div class="wish-item">
+                <img src="${item.img || 'https://via.placeholder.com/100'}" alt="Art">
+                <div style="flex:1">
+                    <h4 style="margin:0; font-size:0.85rem; font-weight:700; color: #222;">${item.name}</h4>
+                    <p style="margin:2px 0 0; color:var(--primary); font-weight:800; font-size:0.8rem;">${item.price}</p>
+                </div>
+                <i class="fas fa-trash-alt" onclick="removeFromWishlist(${index})" 
+                   style="cursor:pointer; color:#ddd; transition:0.3s; padding: 10px;"></i>
+            </div>
+        `).join('');
+    }
+}
+
+function removeFromWishlist(index) {
+    wishlist.splice(index, 1);
+    localStorage.setItem('heartscript_wish', JSON.stringify(wishlist));
+    updateWishlistDisplay();
+}
+
+function toggleWishlistSidebar() {
+    document.getElementById('wishlist-sidebar').classList.toggle('open');
+}
+
+// Trigger on load
+window.onload = () => {
+    updateWishlistDisplay();
+    fireConfetti();
+
+    // Auto-close sidebar after 5 seconds if open (Optional)
+    setTimeout(() => {
+        const sidebar = document.getElementById('wishlist-sidebar');
+        if(sidebar.classList.contains('open')) toggleWishlistSidebar();
+    }, 6000);
+};
@@ -0,0 +1,367 @@
+"""Route benchmark for HeartScript.
+
+Boots the Flask app in-process against mongomock (default) or a local mongod,
+seeds it, and drives the main routes at a set concurrency. For each route it
+reports p50/p95/p99 latency, requests/sec and Mongo operations per request,
+and writes everything to a JSON file that can be compared with an older run.
+
+    python bench.py                                  # mongomock, default sizes
+    python bench.py --mongo mongodb://localhost:27017 --concurrency 16
+    python bench.py --routes shop,product --requests 1000
+    python bench.py --compare bench-results/<older run>.json
+
+mongomock is only needed for the default backend (`pip install mongomock`).
+Against a real server the benchmark uses (and drops) the `--db` database,
+so never point it at production.
+"""
+import os
+import sys
+import copy
+import json
+import time
+import uuid
+import random
+import argparse
+import platform
+import threading
+import subprocess
+import contextlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+ADMIN_PASSWORD = 'HeartScript@Admin2025'
+USER_PASSWORD = 'bench-password'
+DEFAULT_ROUTES = ('shop', 'product', 'checkout', 'submit_order', 'download_invoice', 'admin', 'user_login', 'admin_login')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--mongo', default='mongomock', help="'mongomock' or a mongodb:// URI of a local server")
+    parser.add_argument('--db', default='heartscript_bench', help="database to seed (dropped first)")
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--products', type=int, default=300)
+    parser.add_argument('--categories', type=int, default=8)
+    parser.add_argument('--orders', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=300, help="measured requests per route")
+    parser.add_argument('--warmup', type=int, default=20, help="unmeasured requests per route")
+    parser.add_argument('--routes', default=','.join(DEFAULT_ROUTES), help="comma-separated subset of: " + ', '.join(DEFAULT_ROUTES))
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="JSON result path (default: bench-results/<commit>-<timestamp>.json)")
+    parser.add_argument('--compare', help="earlier result file to print deltas against")
+    return parser.parse_args(argv)
+
+
+def configure_environment(args):
+    # Must run before the app is imported: limits and pool sizes are read at import time
+    os.environ['MONGO_DB_NAME'] = args.db
+    if args.mongo != 'mongomock':
+        os.environ['MONGO_URI'] = args.mongo
+    for name in ('AUTH_IP_ATTEMPTS_PER_MIN', 'AUTH_EMAIL_ATTEMPTS_PER_MIN', 'ADMIN_LOGIN_ATTEMPTS_PER_MIN'):
+        os.environ[name] = str(10 ** 9)
+    os.environ.setdefault('PASSWORD_HASH_MAX_PENDING', str(max(64, args.concurrency * 4)))
+
+
+# --- Mongo operation counting ---
+# Counters are thread-local so concurrent requests each see only their own ops.
+# Against a server every command is counted (including getMore); mongomock has no
+# command monitoring, so there each collection method call counts as one op.
+_ops = threading.local()
+
+
+def _count_op():
+    _ops.count = getattr(_ops, 'count', 0) + 1
+
+
+def thread_ops():
+    return getattr(_ops, 'count', 0)
+
+
+def install_op_counter(appmod, backend):
+    if backend == 'mongomock':
+        original = appmod._LazyCollection.__getattr__
+
+        def counting_getattr(self, attr):
+            value = original(self, attr)
+            if not callable(value):
+                return value
+
+            # mongomock edits projection/filter dicts in place, which races when
+            # threads share the app's module-level field specs; hand it copies
+            def call(*a, **k):
+                _count_op()
+                a = [copy.deepcopy(v) if isinstance(v, dict) else v for v in a]
+                k = {key: copy.deepcopy(v) if isinstance(v, dict) else v for key, v in k.items()}
+                return value(*a, **k)
+            return call
+        appmod._LazyCollection.__getattr__ = counting_getattr
+    else:
+        from pymongo import monitoring
+
+        class OpCounter(monitoring.CommandListener):
+            def started(self, event):
+                _count_op()
+
+            def succeeded(self, event):
+                pass
+
+            def failed(self, event):
+                pass
+        monitoring.register(OpCounter())
+
+
+def load_app(args):
+    configure_environment(args)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    if args.mongo == 'mongomock':
+        try:
+            import mongomock
+        except ImportError:
+            raise SystemExit("mongomock is not installed: pip install mongomock, or pass --mongo mongodb://localhost:27017")
+        import app as appmod
+        shared = mongomock.MongoClient()
+        appmod.MongoClient = lambda *a, **k: shared
+    else:
+        import app as appmod
+    install_op_counter(appmod, args.mongo)
+    appmod.app.config['TESTING'] = True
+    return appmod
+
+
+# --- Seeding ---
+
+def seed(appmod, args, rng):
+    from werkzeug.security import generate_password_hash
+
+    db = appmod.get_db()
+    appmod.get_mongo_client().drop_database(db.name)
+    with contextlib.redirect_stdout(open(os.devnull, 'w')):
+        appmod.ensure_indexes()
+
+    category_ids = appmod.mg_categories.insert_many(
+        [{"name": f"Category {i}"} for i in range(args.categories)]
+    ).inserted_ids
+    products = [{
+        "name": f"Bench Product {i}",
+        "price": rng.randint(99, 2999),
+        "description": f"Handwritten bench item number {i} with archival ink",
+        "category_id": str(rng.choice(category_ids)),
+        "image_url": f"https://example.com/img/{i}.jpg",
+    } for i in range(args.products)]
+    appmod.mg_products.insert_many(products)
+
+    # One shared hash keeps seeding fast; the login benchmark still pays a full check
+    password_hash = generate_password_hash(USER_PASSWORD, appmod.PASSWORD_HASH_METHOD)
+    users = [{
+        "username": f"bench{i}",
+        "email": f"bench{i}@example.com",
+        "password_hash": password_hash,
+        "phone": "9999999999",
+        "address": "Bench Street",
+        "pincode": str(110001 + i % 50),
+        "role": "customer",
+        "created_at": datetime.utcnow(),
+    } for i in range(args.users)]
+    appmod.mg_users.insert_many(users)
+
+    now = datetime.utcnow()
+    statuses = ['Pending', 'COD - Pending', 'Shipped', 'Delivered']
+    orders = []
+    for i in range(args.orders):
+        product = rng.choice(products)
+        user = rng.choice(users)
+        orders.append({
+            "user_id": str(user['_id']),
+            "name": user['username'],
+            "phone": user['phone'],
+            "house_no": str(i),
+            "address": user['address'],
+            "pincode": user['pincode'],
+            "custom_details": "",
+            "total": str(product['price']),
+            "total_amount": float(product['price']),
+            "items": product['name'],
+            "status": rng.choice(statuses),
+            "date_ordered": now - timedelta(minutes=rng.randint(0, 90 * 24 * 60)),
+        })
+    if orders:
+        appmod.mg_orders.insert_many(orders)
+    appmod.rebuild_order_stats()
+    appmod.build_recommendations()
+    return {
+        "products": [str(p['_id']) for p in products],
+        "users": users,
+        "orders": [str(o['_id']) for o in orders],
+    }
+
+
+# --- Scenarios ---
+# Each scenario is (client kind, request builder). A builder gets the random
+# generator and the seeded data and returns (method, path, request kwargs).
+
+def _user_order(rng, data):
+    return {
+        "name": "Bench Buyer", "phone": "9999999999", "address": "Bench Street",
+        "pincode": "110001", "total": "499", "items": rng.choice(data['products_by_name']),
+        "idempotency_key": uuid.uuid4().hex,
+    }
+
+
+SCENARIOS = {
+    'shop': ('anon', lambda rng, data: ('GET', '/shop', {})),
+    'product': ('anon', lambda rng, data: ('GET', f"/product/{rng.choice(data['products'])}", {})),
+    'checkout': ('user', lambda rng, data: ('GET', f"/checkout/{rng.choice(data['products'])}", {})),
+    'submit_order': ('user', lambda rng, data: ('POST', '/submit_order', {"json": _user_order(rng, data)})),
+    'download_invoice': ('user', lambda rng, data: ('GET', f"/download_invoice/{rng.choice(data['orders'])}", {})),
+    'admin': ('admin', lambda rng, data: ('GET', '/admin', {})),
+    'user_login': ('anon', lambda rng, data: ('POST', '/user_login', {"data": {
+        "email": rng.choice(data['users'])['email'], "password": USER_PASSWORD}})),
+    'admin_login': ('anon', lambda rng, data: ('POST', '/admin-login', {"data": {"password": ADMIN_PASSWORD}})),
+}
+
+
+def make_client(appmod, kind, rng, data):
+    client = appmod.app.test_client()
+    if kind == 'user':
+        user = rng.choice(data['users'])
+        response = client.post('/user_login', data={"email": user['email'], "password": USER_PASSWORD})
+        if response.status_code != 302:
+            raise RuntimeError(f"bench login failed with {response.status_code}")
+    elif kind == 'admin':
+        with client.session_transaction() as sess:
+            sess['admin_logged_in'] = True
+    return client
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def run_route(appmod, name, args, data):
+    kind, build = SCENARIOS[name]
+    total = args.warmup + args.requests
+    issued = iter(range(total))
+    issued_lock = threading.Lock()
+    samples = []
+    samples_lock = threading.Lock()
+
+    def worker(worker_id):
+        rng = random.Random(args.seed * 1000 + worker_id)
+        client = make_client(appmod, kind, rng, data)
+        local = []
+        while True:
+            with issued_lock:
+                n = next(issued, None)
+            if n is None:
+                break
+            method, path, kwargs = build(rng, data)
+            ops_before = thread_ops()
+            started = time.perf_counter()
+            response = client.open(path, method=method, **kwargs)
+            response.get_data()
+            elapsed = time.perf_counter() - started
+            if n >= args.warmup:
+                local.append((started, elapsed, response.status_code, thread_ops() - ops_before))
+        with samples_lock:
+            samples.extend(local)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(worker, range(args.concurrency)))
+
+    latencies = sorted(s[1] for s in samples)
+    # Wall time of the measured window: first measured start to last measured finish
+    window = (max(s[0] + s[1] for s in samples) - min(s[0] for s in samples)) if samples else 0
+    statuses = Counter(s[2] for s in samples)
+    return {
+        "requests": len(samples),
+        "errors": sum(count for status, count in statuses.items() if status >= 500),
+        "status_counts": {str(status): count for status, count in sorted(statuses.items())},
+        "rps": round(len(samples) / window, 2) if window else None,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+            "p95": round(percentile(latencies, 95) * 1000, 3) if latencies else None,
+            "p99": round(percentile(latencies, 99) * 1000, 3) if latencies else None,
+            "mean": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else None,
+            "max": round(latencies[-1] * 1000, 3) if latencies else None,
+        },
+        "mongo_ops_per_request": round(sum(s[3] for s in samples) / len(samples), 2) if samples else None,
+    }
+
+
+# --- Reporting ---
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(results, baseline=None):
+    header = f"{'route':<18}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/req':>9}{'5xx':>6}"
+    print(header)
+    print('-' * len(header))
+    for name, r in results.items():
+        lat = r['latency_ms']
+        print(f"{name:<18}{r['rps'] or 0:>10.1f}{lat['p50'] or 0:>10.2f}{lat['p95'] or 0:>10.2f}"
+              f"{lat['p99'] or 0:>10.2f}{r['mongo_ops_per_request'] or 0:>9.2f}{r['errors']:>6}")
+        old = (baseline or {}).get(name)
+        if old and old.get('rps') and old['latency_ms'].get('p95') and r['rps'] and lat['p95']:
+            print(f"{'':<18}{(r['rps'] / old['rps'] - 1) * 100:>+9.1f}%"
+                  f"{'':>10}{(lat['p95'] / old['latency_ms']['p95'] - 1) * 100:>+9.1f}%"
+                  f"{'':>10}{(r['mongo_ops_per_request'] or 0) - (old.get('mongo_ops_per_request') or 0):>+9.2f}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    routes = [r.strip() for r in args.routes.split(',') if r.strip()]
+    unknown = [r for r in routes if r not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"Unknown routes: {', '.join(unknown)}")
+
+    rng = random.Random(args.seed)
+    appmod = load_app(args)
+    print(f"Seeding {args.users} users, {args.products} products, {args.orders} orders ({args.mongo})...")
+    data = seed(appmod, args, rng)
+    data['products_by_name'] = [p['name'] for p in appmod.mg_products.find({}, {"name": 1})]
+
+    results = {}
+    for name in routes:
+        print(f"  {name}...", flush=True)
+        results[name] = run_route(appmod, name, args, data)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f).get('results')
+    print()
+    print_table(results, baseline)
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "created_at": datetime.utcnow().isoformat() + 'Z',
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": 'mongomock' if args.mongo == 'mongomock' else 'mongod',
+        "settings": {k: v for k, v in vars(args).items() if k not in ('output', 'compare')},
+        "results": results,
+    }
+    output = args.output or os.path.join(
+        'bench-results', f"{commit or 'nogit'}-{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {output}")
+
+
+if __name__ == '__main__':
+    main()
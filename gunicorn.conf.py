@@ -0,0 +1,25 @@
+# Loaded automatically by gunicorn from the working directory.
+import os
+import shutil
+import tempfile
+
+# Workers share Prometheus samples through files in this directory; it has to be
+# set before the app (and prometheus_client) is imported by --preload.
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'heartscript-metrics')
+)
+os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+def on_starting(server):
+    # Samples from a previous run would otherwise be merged into this one
+    shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+# Threaded workers, so long-lived requests such as the admin order feed (SSE)
+# do not hold a whole worker
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 8))